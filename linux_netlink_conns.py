@@ -0,0 +1,183 @@
+"""
+Enumerate TCP/UDP sockets on Linux with a single NETLINK_SOCK_DIAG dump
+instead of asking psutil, which walks /proc/<pid>/fd for every process on
+every call.
+
+Owning PIDs still have to come from /proc/<pid>/fd, but the (pid, fd) each
+socket inode was found at is kept across scans and re-checked with one
+readlink per socket, so /proc is only walked for inodes that are new or
+have changed hands. Inodes that could not be resolved (typically sockets of
+other users' processes) are only searched for again every few scans.
+
+Results mirror the shape of psutil.net_connections() so the GUI can use
+either source interchangeably.
+"""
+import os
+import socket
+import struct
+from collections import namedtuple
+
+NETLINK_SOCK_DIAG = 4
+SOCK_DIAG_BY_FAMILY = 20
+
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+
+_NLMSGHDR = struct.Struct("=IHHII")
+_INET_DIAG_REQ_V2 = struct.Struct("=BBBxI48x")  # family, protocol, ext, states, zeroed sockid
+_INET_DIAG_MSG_LEN = 72
+_ALL_STATES = 0xFFFFFFFF
+
+# Kernel TCP state numbers -> psutil status strings.
+_TCP_STATES = {
+    1: "ESTABLISHED",
+    2: "SYN_SENT",
+    3: "SYN_RECV",
+    4: "FIN_WAIT1",
+    5: "FIN_WAIT2",
+    6: "TIME_WAIT",
+    7: "CLOSE",
+    8: "CLOSE_WAIT",
+    9: "LAST_ACK",
+    10: "LISTEN",
+    11: "CLOSING",
+}
+
+_QUERIES = (
+    (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP),
+    (socket.AF_INET6, socket.SOCK_STREAM, socket.IPPROTO_TCP),
+    (socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP),
+    (socket.AF_INET6, socket.SOCK_DGRAM, socket.IPPROTO_UDP),
+)
+
+addr = namedtuple("addr", ["ip", "port"])
+sconn = namedtuple("sconn", ["fd", "family", "type", "laddr", "raddr", "status", "pid"])
+
+
+def _dump(sock, seq, family, sock_type, protocol):
+    req = _INET_DIAG_REQ_V2.pack(family, protocol, 0, _ALL_STATES)
+    hdr = _NLMSGHDR.pack(_NLMSGHDR.size + len(req), SOCK_DIAG_BY_FAMILY,
+                         NLM_F_REQUEST | NLM_F_DUMP, seq, 0)
+    sock.sendto(hdr + req, (0, 0))
+
+    addr_len = 4 if family == socket.AF_INET else 16
+    while True:
+        data = sock.recv(1 << 16)
+        off = 0
+        while off + _NLMSGHDR.size <= len(data):
+            msg_len, msg_type, _, _, _ = _NLMSGHDR.unpack_from(data, off)
+            if msg_len < _NLMSGHDR.size:
+                return
+            if msg_type == NLMSG_DONE:
+                return
+            if msg_type == NLMSG_ERROR:
+                errno = -struct.unpack_from("=i", data, off + _NLMSGHDR.size)[0]
+                raise OSError(errno, os.strerror(errno))
+            body = off + _NLMSGHDR.size
+            if msg_len - _NLMSGHDR.size >= _INET_DIAG_MSG_LEN:
+                state = data[body + 1]
+                sport, dport = struct.unpack_from("!HH", data, body + 4)
+                src = data[body + 8:body + 8 + addr_len]
+                dst = data[body + 24:body + 24 + addr_len]
+                inode = struct.unpack_from("=I", data, body + 68)[0]
+
+                laddr = addr(socket.inet_ntop(family, src), sport)
+                raddr = addr(socket.inet_ntop(family, dst), dport) if dport else ()
+                if sock_type == socket.SOCK_STREAM:
+                    status = _TCP_STATES.get(state, "NONE")
+                else:
+                    status = "NONE"
+                yield family, sock_type, laddr, raddr, status, inode
+            off += (msg_len + 3) & ~3
+
+
+def iter_inet_sockets():
+    """
+    Yield (family, type, laddr, raddr, status, inode) for every TCP and UDP
+    socket over IPv4 and IPv6. Raises OSError if SOCK_DIAG is unavailable.
+    """
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_SOCK_DIAG) as sock:
+        for seq, (family, sock_type, protocol) in enumerate(_QUERIES, 1):
+            yield from _dump(sock, seq, family, sock_type, protocol)
+
+
+_inode_owner = {}  # socket inode -> (pid, fd) it was last found at
+_unresolved = {}  # inode -> scans left before a failed lookup is retried
+_UNRESOLVED_RETRY_SCANS = 12
+
+
+def pids_for_inodes(inodes):
+    """
+    Map socket inodes to owning PIDs. Each cached owner is re-checked with a
+    single readlink of /proc/<pid>/fd/<fd>, so sockets that outlive or move
+    away from their original process are looked up again. Only inodes that
+    are new, moved, or due for a retry trigger a walk of /proc/[0-9]*/fd,
+    which stops as soon as all of them are found; processes we are not
+    allowed to inspect are skipped.
+    """
+    current = {inode for inode in inodes if inode}
+    for inode in _inode_owner.keys() - current:
+        del _inode_owner[inode]
+    for inode in _unresolved.keys() - current:
+        del _unresolved[inode]
+
+    for inode, (pid, fd) in list(_inode_owner.items()):
+        try:
+            held = os.readlink(f"/proc/{pid}/fd/{fd}") == f"socket:[{inode}]"
+        except OSError:
+            held = False
+        if not held:
+            del _inode_owner[inode]
+
+    new = set()
+    for inode in current - _inode_owner.keys():
+        left = _unresolved.get(inode, 0)
+        if left > 0:
+            _unresolved[inode] = left - 1
+        else:
+            new.add(inode)
+
+    if new:
+        wanted = {f"socket:[{inode}]": inode for inode in new}
+        found = 0
+        with os.scandir("/proc") as procs:
+            for proc in procs:
+                if not proc.name.isdigit():
+                    continue
+                try:
+                    with os.scandir(f"{proc.path}/fd") as fds:
+                        for fd in fds:
+                            if not fd.is_symlink():
+                                continue
+                            try:
+                                inode = wanted.get(os.readlink(fd.path))
+                            except OSError:
+                                continue
+                            if inode is not None and inode not in _inode_owner:
+                                _inode_owner[inode] = (int(proc.name), fd.name)
+                                found += 1
+                except OSError:
+                    continue
+                if found == len(wanted):
+                    break
+        for inode in new:
+            if inode in _inode_owner:
+                _unresolved.pop(inode, None)
+            else:
+                _unresolved[inode] = _UNRESOLVED_RETRY_SCANS
+
+    return {inode: _inode_owner[inode][0] for inode in current if inode in _inode_owner}
+
+
+def net_connections():
+    """
+    Drop-in replacement for psutil.net_connections(kind='inet') on Linux.
+    """
+    socks = list(iter_inet_sockets())
+    owners = pids_for_inodes(s[5] for s in socks)
+    return [
+        sconn(-1, family, sock_type, laddr, raddr, status, owners.get(inode))
+        for family, sock_type, laddr, raddr, status, inode in socks
+    ]
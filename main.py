@@ -3,41 +3,385 @@ import os
 import socket
 import signal
 import subprocess
+import time
 import psutil
-from functools import partial
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import linux_netlink_conns
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QMessageBox, QLabel, QHeaderView, QSizePolicy,
-    QAbstractItemView
+    QTableView, QMessageBox, QLabel, QHeaderView, QSizePolicy,
+    QAbstractItemView, QStyledItemDelegate, QStyle
 )
-from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtCore import (
+    Qt, QTimer, Slot, Signal, QObject, QRunnable, QThreadPool, QEvent,
+    QAbstractTableModel, QModelIndex, QPersistentModelIndex, QSize, QRect, QPoint
+)
+from PySide6.QtGui import QPainter, QColor, QLinearGradient, QPixmap
 
 APP_REFRESH_INTERVAL_MS = 5000  # auto-refresh interval (ms). Set 0 to disable.
+SCAN_BUDGET = 0.10  # max fraction of the refresh interval a scan may take
+SCAN_HISTORY = 10  # number of recent scan durations used to adapt the interval
+SEARCH_DEBOUNCE_MS = 120  # delay after the last keystroke before filtering
+NAME_LOOKUP_WORKERS = 8  # threads used to resolve process names in parallel
+_PSUTIL_KINDS = ("inet4", "inet6")  # psutil kinds queried outside Linux
+
+def net_connections():
+    """
+    Enumerate inet sockets, using a single netlink SOCK_DIAG dump on Linux
+    and falling back to psutil elsewhere or if netlink is unavailable.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            return linux_netlink_conns.net_connections()
+        except OSError:
+            return psutil.net_connections(kind='inet')  # inet covers tcp/udp
+    # Asking for each family explicitly lets the BSD/macOS/Windows backends
+    # skip unrelated socket families instead of filtering them afterwards.
+    conns = []
+    for kind in _PSUTIL_KINDS:
+        conns.extend(psutil.net_connections(kind=kind))
+    return conns
+
+_PROTO = {socket.SOCK_STREAM: "TCP", socket.SOCK_DGRAM: "UDP"}
+
+class AddrTextCache:
+    """
+    "ip:port" strings keyed by the (ip, port) address tuple, so addresses
+    repeated within and across scans share one string. Only addresses seen
+    since the last retain() are kept.
+    """
+    def __init__(self):
+        self._text = {}  # addresses kept from the previous scan
+        self._seen = {}  # addresses formatted during the current scan
+
+    def __call__(self, addr):
+        if not addr:
+            return ""
+        text = self._seen.get(addr)
+        if text is None:
+            text = self._text.get(addr) or addr.ip + ":" + str(addr.port)
+            self._seen[addr] = text
+        return text
+
+    def retain(self):
+        """Keep only the addresses formatted since the previous call."""
+        self._text, self._seen = self._seen, {}
+
+format_local_addr = AddrTextCache()
+
+class ProcNameCache:
+    """
+    Process names keyed by (pid, create_time), so long-lived processes are
+    only looked up once and a reused PID is never given a stale name. The
+    psutil.Process of the latest lookup is kept in ``procs`` for reuse.
+    """
+    def __init__(self):
+        self._name_cache = {}  # pid -> (create_time, name)
+        self.procs = {}  # pid -> psutil.Process
+
+    def __call__(self, pid):
+        try:
+            p = psutil.Process(pid)
+            ct = p.create_time()
+            self.procs[pid] = p
+            cached = self._name_cache.get(pid)
+            if cached is not None and cached[0] == ct:
+                return cached[1]
+            with p.oneshot():
+                name = p.name()
+            self._name_cache[pid] = (ct, name)
+            return name
+        except Exception:
+            return "<unknown>"
+
+    def retain(self, pids):
+        """Forget every cached process whose PID is not in ``pids``."""
+        for pid in self._name_cache.keys() - pids:
+            del self._name_cache[pid]
+        for pid in self.procs.keys() - pids:
+            del self.procs[pid]
+
+safe_proc_name = ProcNameCache()
+_name_pool = ThreadPoolExecutor(max_workers=NAME_LOOKUP_WORKERS)  # reused by every scan
+
+class ConnRows:
+    """
+    Display rows stored column-wise, one tuple per field, so filtering only
+    has to walk ``blob`` (or ``num_blob`` plus ``pid`` for numeric queries).
+    Indexing returns the row tuple
+    (proto, laddr, raddr, status, pid, pname, port, blob, num_blob).
+    """
+    def __init__(self, rows=()):
+        self.columns = tuple(zip(*rows)) or ((),) * 9
+        (self.proto, self.laddr, self.raddr, self.status,
+         self.pid, self.pname, self.port, self.blob, self.num_blob) = self.columns
+
+    def __len__(self):
+        return len(self.blob)
+
+    def __getitem__(self, i):
+        return tuple(col[i] for col in self.columns)
+
+def scan_connections():
+    """
+    Gather active network connections and return them as sorted ConnRows.
+    The local port and lowercase searchable blobs are derived once per row
+    here so sorting and filtering never recompute them.
+    """
+    conns = net_connections()
+
+    unique_pids = {c.pid for c in conns if c.pid}
+    name_by_pid = dict(zip(unique_pids, _name_pool.map(safe_proc_name, unique_pids)))
+
+    rows = []
+    for c in conns:
+        pid = c.pid if c.pid is not None else -1
+        proto = _PROTO.get(c.type) or str(c.type)
+        laddr = format_local_addr(c.laddr) if c.laddr else ""
+        raddr = format_local_addr(c.raddr) if c.raddr else ""
+        status = c.status or ""
+        pname = name_by_pid.get(pid, "")
+        port = int(c.laddr.port) if c.laddr else 0
+        blob = "\0".join((proto, laddr, raddr, status, str(pid) if pid > 0 else "", pname)).lower()
+        num_blob = "\0".join((laddr, raddr, pname)).lower()  # fields a numeric query can hit
+        rows.append((proto, laddr, raddr, status, pid, pname, port, blob, num_blob))
+    del conns  # release psutil's sconn tuples before sorting and transposing
+
+    rows.sort(key=lambda r: (r[6], r[0], r[5] or ""))
+    safe_proc_name.retain(unique_pids)
+    format_local_addr.retain()
+    return ConnRows(rows)
+
+class ScanSignals(QObject):
+    finished = Signal(object, float)  # ConnRows, scan duration (s)
+    failed = Signal(str)
+
+class ConnScanner(QRunnable):
+    """
+    Runs scan_connections() off the GUI thread and reports back through
+    ``signals``, a ScanSignals owned by the GUI thread. The thread pool
+    deletes the runnable once run() returns.
+    """
+    def __init__(self, signals):
+        super().__init__()
+        self.setAutoDelete(True)
+        self.signals = signals
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            rows = scan_connections()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(rows, time.perf_counter() - start)
+
+class ConnModel(QAbstractTableModel):
+    """
+    Table model showing the rows of a ConnRows store selected by ``index``.
+    The store is referenced, not copied, and replaced with a single model reset.
+    """
+    HEADERS = ["Proto", "Local", "Remote", "Status", "PID", "Process", ""]
+    KILL_COLUMN = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = ConnRows()
+        self._index = []
+
+    def set_rows(self, rows, index):
+        self.beginResetModel()
+        self._rows = rows
+        self._index = index
+        self.endResetModel()
+
+    def row_data(self, row):
+        return self._rows[self._index[row]]
 
-def format_local_addr(addr):
-    if not addr:
-        return ""
-    return f"{addr.ip}:{addr.port}"
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._index)
 
-def safe_proc_name(pid):
-    try:
-        p = psutil.Process(pid)
-        return p.name()
-    except Exception:
-        return "<unknown>"
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == self.KILL_COLUMN:
+                return None  # painted by KillDelegate
+            value = self._rows.columns[col][self._index[index.row()]]
+            if col == 4:
+                return str(value) if value > 0 else ""
+            return value or ""
+        if role == Qt.TextAlignmentRole and col == 0:
+            return Qt.AlignCenter
+        if role == Qt.ToolTipRole and col == self.KILL_COLUMN:
+            return "Kill the process that owns this socket"
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+class KillDelegate(QStyledItemDelegate):
+    """
+    Paints a "Kill" button in each cell of its column of ``view`` and emits
+    ``kill_requested(row)`` when one is clicked, so no per-row widgets or
+    callbacks are needed. Like a QPushButton, a click needs both press and
+    release on the same button.
+    Each button state is rendered once into a pixmap shared by every cell
+    and only redrawn when the cell size changes.
+    """
+    kill_requested = Signal(int)  # model row
+
+    # Gradient stops per button state, matching the app's QPushButton style.
+    _GRADIENTS = {
+        "normal": ("#6fb1ff", "#4a90e2"),
+        "hover": ("#7ec4ff", "#5aa1ef"),
+        "pressed": ("#4a90e2", "#3a7bc8"),
+    }
+
+    def __init__(self, view):
+        super().__init__(view)
+        self._view = view
+        self._pixmaps = {}  # (state, width, height, dpr) -> QPixmap
+        self._pressed = QPersistentModelIndex()
+        view.setMouseTracking(True)  # keep State_MouseOver current for hover
+        view.viewport().setAttribute(Qt.WA_Hover)
+        view.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        # Any press on the view cancels a pending click; editorEvent() re-arms
+        # it when the press lands on a Kill button.
+        if event.type() == QEvent.MouseButtonPress and self._pressed.isValid():
+            self._set_pressed(QPersistentModelIndex())
+        return False
+
+    def _set_pressed(self, index):
+        old, self._pressed = self._pressed, index
+        for idx in (old, index):
+            if idx.isValid():
+                self._view.update(self._view.model().index(idx.row(), idx.column()))
+
+    def _button_pixmap(self, state, size, dpr):
+        key = (state, size.width(), size.height(), dpr)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            if any(k[1:] != key[1:] for k in self._pixmaps):
+                self._pixmaps.clear()  # cell size changed; drop old renders
+            pixmap = QPixmap(size * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            rect = QRect(QPoint(0, 0), size)
+            top, bottom = self._GRADIENTS[state]
+            grad = QLinearGradient(rect.topLeft(), rect.bottomLeft())
+            grad.setColorAt(0, QColor(top))
+            grad.setColorAt(1, QColor(bottom))
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(grad)
+            painter.drawRoundedRect(rect, 6, 6)
+            painter.setPen(Qt.white)
+            painter.drawText(rect, Qt.AlignCenter, "Kill")
+            painter.end()
+            self._pixmaps[key] = pixmap
+        return pixmap
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        if not option.state & QStyle.State_MouseOver:
+            state = "normal"
+        elif self._pressed == QPersistentModelIndex(index):
+            state = "pressed"
+        else:
+            state = "hover"
+        rect = option.rect.adjusted(4, 3, -4, -3)
+        painter.drawPixmap(rect.topLeft(), self._button_pixmap(state, rect.size(), painter.device().devicePixelRatioF()))
+
+    def sizeHint(self, option, index):
+        return QSize(64, 28)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease) and event.button() == Qt.LeftButton:
+            inside = option.rect.contains(event.position().toPoint())
+            if event.type() == QEvent.MouseButtonPress:
+                if inside:
+                    self._set_pressed(QPersistentModelIndex(index))
+                    return True
+            else:
+                armed = self._pressed == QPersistentModelIndex(index)
+                if self._pressed.isValid():
+                    self._set_pressed(QPersistentModelIndex())
+                if armed and inside:
+                    self.kill_requested.emit(index.row())
+                    return True
+        return super().editorEvent(event, model, option, index)
 
 class PortInspector(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Port Inspector")
         self.resize(900, 600)
+        self._scanning = False  # a ConnScanner is in flight
+        self._scan_signals = ScanSignals(self)
+        self._scan_signals.finished.connect(self.on_scan_finished)
+        self._scan_signals.failed.connect(self.on_scan_failed)
+        self._proc_cache = safe_proc_name.procs  # pid -> psutil.Process, filled by scans
+        self._scan_durations = deque(maxlen=SCAN_HISTORY)
+        self._timer = None
         self.setup_ui()
         self.refresh()  # initial populate
 
         if APP_REFRESH_INTERVAL_MS > 0:
             self._timer = QTimer(self)
+            self._timer.setTimerType(Qt.CoarseTimer)  # don't force a high-resolution system tick
             self._timer.timeout.connect(self.refresh)
             self._timer.start(APP_REFRESH_INTERVAL_MS)
+            QApplication.instance().applicationStateChanged.connect(self.on_app_state_changed)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.resume_refresh()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.pause_refresh()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.pause_refresh()
+            else:
+                self.resume_refresh()
+
+    @Slot(Qt.ApplicationState)
+    def on_app_state_changed(self, state):
+        if state in (Qt.ApplicationSuspended, Qt.ApplicationHidden):
+            self.pause_refresh()
+        elif state == Qt.ApplicationActive:
+            self.resume_refresh()
+
+    def pause_refresh(self):
+        if self._timer is not None:
+            self._timer.stop()
+
+    def resume_refresh(self):
+        """
+        Restart auto-refresh if it was paused and the window is actually on
+        screen, refreshing right away since the table may be stale.
+        """
+        if self._timer is None or self._timer.isActive():
+            return
+        if not self.isVisible() or self.isMinimized():
+            return
+        self.refresh()
+        self._timer.start()
 
     def setup_ui(self):
         v = QVBoxLayout(self)
@@ -59,7 +403,10 @@ class PortInspector(QWidget):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by port, process name or PID")
-        self.search_input.textChanged.connect(self.apply_filter)
+        self._filter_timer = QTimer(self, singleShot=True, interval=SEARCH_DEBOUNCE_MS,
+                                    timerType=Qt.CoarseTimer)
+        self._filter_timer.timeout.connect(self.apply_filter)
+        self.search_input.textChanged.connect(lambda _: self._filter_timer.start())
         search_layout.addWidget(self.search_input)
 
         clear_btn = QPushButton("Clear")
@@ -69,8 +416,12 @@ class PortInspector(QWidget):
         v.addLayout(search_layout)
 
         # Table
-        self.table = QTableWidget(0, 7)
-        self.table.setHorizontalHeaderLabels(["Proto", "Local", "Remote", "Status", "PID", "Process", ""])
+        self.model = ConnModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        kill_delegate = KillDelegate(self.table)
+        kill_delegate.kill_requested.connect(self.on_kill_row)
+        self.table.setItemDelegateForColumn(ConnModel.KILL_COLUMN, kill_delegate)
         header_view = self.table.horizontalHeader()
         header_view.setSectionResizeMode(1, QHeaderView.Stretch)
         header_view.setSectionResizeMode(5, QHeaderView.Stretch)
@@ -81,10 +432,10 @@ class PortInspector(QWidget):
         header_view.setSectionResizeMode(4, QHeaderView.ResizeToContents)
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 font-size: 13px;
             }
             QHeaderView::section {
@@ -93,10 +444,6 @@ class PortInspector(QWidget):
                 border: 1px solid #dfe7f5;
                 font-weight: 600;
             }
-            QPushButton {
-                padding: 4px 8px;
-                border-radius: 6px;
-            }
         """)
         v.addWidget(self.table)
 
@@ -110,80 +457,60 @@ class PortInspector(QWidget):
     @Slot()
     def refresh(self):
         """
-        Gather active network connections using psutil and display them.
+        Gather active network connections on a worker thread and display them
+        once the scan finishes. Requests made while a scan is running are dropped.
         """
-        try:
-            conns = psutil.net_connections(kind='inet')  # inet covers tcp/udp
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to enumerate connections:\n{e}")
+        if self._scanning:
             return
+        self._scanning = True
+        QThreadPool.globalInstance().start(ConnScanner(self._scan_signals))
 
-        rows = []
-        for c in conns:
-            pid = c.pid if c.pid is not None else -1
-            proto = "TCP" if c.type == socket.SOCK_STREAM else "UDP" if c.type == socket.SOCK_DGRAM else str(c.type)
-            laddr = format_local_addr(c.laddr) if c.laddr else ""
-            raddr = format_local_addr(c.raddr) if c.raddr else ""
-            status = c.status if hasattr(c, "status") else ""
-            pname = safe_proc_name(pid) if pid > 0 else ""
-            rows.append((proto, laddr, raddr, status, pid, pname))
-
-        def sort_key(r):
-            try:
-                port = int(r[1].rsplit(":", 1)[1]) if ":" in r[1] else 0
-            except Exception:
-                port = 0
-            return (port, r[0], r[5] or "")
-        rows.sort(key=sort_key)
-
+    @Slot(object, float)
+    def on_scan_finished(self, rows, duration):
+        self._scanning = False
+        self._scan_durations.append(duration)
+        if self._timer is not None:
+            # Keep scanning to a bounded share of the period on busy hosts.
+            slowest_ms = int(max(self._scan_durations) * 1000 / SCAN_BUDGET)
+            self._timer.setInterval(max(APP_REFRESH_INTERVAL_MS, slowest_ms))
         self._all_rows = rows
-        self.populate_table(rows)
-        self.apply_filter()
+        self.apply_filter()  # populates the table, filtered or not
         self.status_label.setText(f"{len(rows)} socket(s) found")
 
-    def populate_table(self, rows):
-        self.table.setRowCount(0)
-        for row_data in rows:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            proto_item = QTableWidgetItem(row_data[0])
-            proto_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 0, proto_item)
-            self.table.setItem(row, 1, QTableWidgetItem(row_data[1]))
-            self.table.setItem(row, 2, QTableWidgetItem(row_data[2]))
-            self.table.setItem(row, 3, QTableWidgetItem(row_data[3]))
-            pid_text = str(row_data[4]) if row_data[4] > 0 else ""
-            self.table.setItem(row, 4, QTableWidgetItem(pid_text))
-            proc_item = QTableWidgetItem(row_data[5] or "")
-            self.table.setItem(row, 5, proc_item)
-
-            btn = QPushButton("Kill")
-            btn.setToolTip("Kill the process that owns this socket")
-            btn.clicked.connect(partial(self.on_kill_clicked, row_data[4], row_data[5], row_data[1]))
-            self.table.setCellWidget(row, 6, btn)
+    @Slot(str)
+    def on_scan_failed(self, msg):
+        self._scanning = False
+        QMessageBox.critical(self, "Error", f"Failed to enumerate connections:\n{msg}")
+
+    def populate_table(self, index):
+        """Show the rows of ``self._all_rows`` at the given positions."""
+        self.model.set_rows(self._all_rows, index)
 
     def apply_filter(self):
         q = self.search_input.text().strip().lower()
         if not hasattr(self, "_all_rows"):
             return
         if q == "":
-            self.populate_table(self._all_rows)
+            self.populate_table(range(len(self._all_rows)))
+            return
+
+        rows = self._all_rows
+        if q.isdecimal() and q.isascii():
+            # Digits match within addresses or process names, or the PID
+            # exactly; "007" is not PID 7, as with str(pid) == q.
+            pid = int(q) if q == str(int(q)) else None
+            self.populate_table([
+                i for i, (blob, row_pid) in enumerate(zip(rows.num_blob, rows.pid))
+                if blob.find(q) >= 0 or row_pid == pid
+            ])
             return
 
-        filtered = []
-        for r in self._all_rows:
-            proto, laddr, raddr, status, pid, pname = r
-            if q.isdigit():
-                if q in laddr or q in raddr or q == str(pid):
-                    filtered.append(r)
-                    continue
-            if (q in (pname or "").lower() or
-                q in (proto or "").lower() or
-                q in (laddr or "").lower() or
-                q in (raddr or "").lower() or
-                q in (status or "").lower()):
-                filtered.append(r)
-        self.populate_table(filtered)
+        self.populate_table([i for i, blob in enumerate(rows.blob) if blob.find(q) >= 0])
+
+    @Slot(int)
+    def on_kill_row(self, row):
+        row_data = self.model.row_data(row)
+        self.on_kill_clicked(row_data[4], row_data[5], row_data[1])
 
     def on_kill_clicked(self, pid, pname, local_addr):
         if not pid or pid <= 0:
@@ -207,7 +534,9 @@ class PortInspector(QWidget):
 
     def try_kill_pid(self, pid):
         try:
-            proc = psutil.Process(pid)
+            # psutil checks create_time before signaling, so a cached Process
+            # whose PID was reused raises NoSuchProcess rather than hitting it.
+            proc = self._proc_cache.get(pid) or psutil.Process(pid)
             proc.terminate()
             try:
                 proc.wait(timeout=3)